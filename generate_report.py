@@ -8,21 +8,23 @@ def generate_health_report():
         conn = psycopg2.connect(config.db_dsn)
         cur = conn.cursor()
         
-        # 1. Overall Stats
-        cur.execute("SELECT count(*), count(CASE WHEN status = 'SUCCESS' THEN 1 END) FROM audit_logs")
-        total, success = cur.fetchone()
-        
+        # 1. Overall & Performance Stats (single scan of audit_logs)
+        cur.execute("""
+            SELECT count(*),
+                   count(*) FILTER (WHERE status = 'SUCCESS'),
+                   AVG(duration_ms) FILTER (WHERE status = 'SUCCESS')
+            FROM audit_logs
+        """)
+        total, success, avg_time = cur.fetchone()
+
         if total == 0:
             print("\n📊 NO AUDIT DATA FOUND.")
             return
 
         success_rate = (success / total) * 100
-        
-        # 2. Performance Stats
-        cur.execute("SELECT AVG(duration_ms) FROM audit_logs WHERE status = 'SUCCESS'")
-        avg_time = cur.fetchone()[0] or 0
-        
-        # 3. Error Breakdown
+        avg_time = avg_time or 0
+
+        # 2. Error Breakdown
         cur.execute("""
             SELECT status, count(*), SUBSTRING(message, 1, 100) as msg 
             FROM audit_logs 
@@ -1,26 +1,49 @@
 from typing import Optional, Callable, Iterable
 import re
+from datetime import date
+from functools import lru_cache
 from ftfy import fix_text
-from cleantext import clean
 from babel.numbers import parse_decimal
 from cleaning_constants import BOILERPLATE, HS_PATTERNS
-from dateparser import parse as dateparse
+
+__all__ = [
+    "normalize_text",
+    "RegexCleaner",
+    "clean_hs_label_for_rag",
+    "remove_adil_boilerplate",
+    "parse_percentage",
+    "parse_french_date",
+]
 
 
 # Core Definitions
+# ADIL labels repeat across records (section/chapter/HS4 labels, boilerplate),
+# so the ftfy pass is memoized. Long one-off texts bypass the cache
+# so they don't evict the short labels that actually repeat.
+_NORMALIZE_CACHE_MAX_LEN = 4096
+
 def normalize_text(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
+    if len(text) > _NORMALIZE_CACHE_MAX_LEN:
+        return _normalize_text(text)
+    return _normalize_text_cached(text)
+
+
+# Control characters ftfy removes (\t, \n, \f and \r are only whitespace to it)
+_ASCII_CONTROL_RE = re.compile(r"[\x00-\x08\x0b\x0e-\x1f\x7f]")
+
+
+def _normalize_text(text: str) -> Optional[str]:
+    # ASCII without control characters or HTML entities has nothing for ftfy
+    # to repair, which covers most HS labels
+    if text.isascii() and "&" not in text and not _ASCII_CONTROL_RE.search(text):
+        return " ".join(text.split()) or None
     text = fix_text(text)
+    return " ".join(text.split()) or None
 
-    text = clean(
-        text,
-        fix_unicode=True,
-        to_ascii=False,
-        lower=False,
-        no_line_breaks=False
-    )
-    return " ".join(text.split()) if text else None
+
+_normalize_text_cached = lru_cache(maxsize=4096)(_normalize_text)
 
 
 class RegexCleaner:
@@ -52,12 +75,32 @@ def _pipeline(text: str, *steps: Callable[[str], str]) -> Optional[str]:
 
 
 # Domain Logic (HS, ADIL)
+# Section/chapter/HS4 labels repeat for every product below them, so both
+# cleaners are memoized; None/empty and long texts skip the cache.
+@lru_cache(maxsize=65536)
+def _clean_hs_label_cached(text: str) -> Optional[str]:
+    return _pipeline(text, _HS_CLEANER)
+
+
+@lru_cache(maxsize=65536)
+def _remove_adil_boilerplate_cached(text: str) -> Optional[str]:
+    return _pipeline(text, _ADIL_CLEANER)
+
+
 def clean_hs_label_for_rag(text: Optional[str]) -> Optional[str]:
-    return _pipeline(text, _HS_CLEANER) if text else None
+    if not text:
+        return None
+    if len(text) > _NORMALIZE_CACHE_MAX_LEN:
+        return _pipeline(text, _HS_CLEANER)
+    return _clean_hs_label_cached(text)
 
 
 def remove_adil_boilerplate(text: Optional[str]) -> Optional[str]:
-    return _pipeline(text, _ADIL_CLEANER) if text else None
+    if not text:
+        return None
+    if len(text) > _NORMALIZE_CACHE_MAX_LEN:
+        return _pipeline(text, _ADIL_CLEANER)
+    return _remove_adil_boilerplate_cached(text)
 
 
 # Extractors
@@ -66,8 +109,33 @@ def parse_percentage(value: Optional[str]) -> Optional[float]:
     try: return float(parse_decimal(value.replace("%", "").strip(), locale="fr_FR"))
     except: return None
 
+# Fast path for the formats ADIL actually uses ("01/02/2026", "1er janvier 2026");
+# dateparser is only consulted when these do not match.
+_FR_MONTHS = {
+    "janvier": 1, "février": 2, "fevrier": 2, "mars": 3, "avril": 4, "mai": 5, "juin": 6,
+    "juillet": 7, "août": 8, "aout": 8, "septembre": 9, "octobre": 10, "novembre": 11,
+    "décembre": 12, "decembre": 12,
+}
+# Whole string only (an optional time is allowed); trailing text goes to dateparser
+_DMY_RE = re.compile(
+    r"(\d{1,2})(?:er)?[/\s.-]+(\d{1,2}|[^\W\d_]+)[/\s.-]+(\d{4})"
+    r"(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?\s*"
+)
+
+@lru_cache(maxsize=4096)
 def parse_french_date(text: Optional[str]) -> Optional[str]:
     if not text: return None
+    match = _DMY_RE.fullmatch(text.strip())
+    if match:
+        day, month, year, hour, minute, second = match.groups()
+        month = int(month) if month.isdigit() else _FR_MONTHS.get(month.lower())
+        # An out-of-range time ("25:99") is left to dateparser, which rejects it
+        valid_time = hour is None or (int(hour) < 24 and int(minute) < 60 and int(second or 0) < 60)
+        if month and valid_time:
+            try: return date(int(year), month, int(day)).isoformat()
+            except ValueError: pass
+    # dateparser is slow to import and rarely needed past the fast path
+    from dateparser import parse as dateparse
     parsed = dateparse(text, languages=["fr"])
     return parsed.date().isoformat() if parsed else None
 
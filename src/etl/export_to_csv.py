@@ -1,8 +1,8 @@
 import csv
 import json
 import os
+from itertools import chain
 import psycopg2
-from psycopg2.extras import DictCursor
 
 # Ensure project root and src are in path for imports
 import sys
@@ -19,16 +19,43 @@ from scraper.config import ScraperConfig
 config = ScraperConfig()
 DSN = config.db_dsn
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output_csv")
-RAG_CLEAN_COLUMNS = ['hs6_label', 'designation', 'section_label', 'chapter_label', 'hs4_label', 'hs8_label']
+RAG_CLEAN_COLUMNS = frozenset(['hs6_label', 'designation', 'section_label', 'chapter_label', 'hs4_label', 'hs8_label'])
+
+# Postgres type OIDs for json / jsonb
+JSON_TYPE_OIDS = frozenset([114, 3802])
+
+def _json_columns(description, first_row):
+    """Indices of JSON columns, from the column types plus the first row's values."""
+    return [
+        i for i, desc in enumerate(description)
+        if desc[1] in JSON_TYPE_OIDS or isinstance(first_row[i], (dict, list))
+    ]
+
+def _prepare_row(row, json_idx, clean_idx):
+    values = list(row)
+    # Handle JSON objects
+    for i in json_idx:
+        if isinstance(row[i], (dict, list)):
+            values[i] = json.dumps(row[i], ensure_ascii=False)
+    # Handle Text Cleaning (only the columns resolved once per table)
+    for i in clean_idx:
+        if isinstance(row[i], str):
+            values[i] = clean_hs_label_for_rag(row[i])
+    return values
 
 def export_table(table_name, conn, filename=None):
     print(f"Exporting {table_name}...")
     
-    with conn.cursor(cursor_factory=DictCursor) as cur:
+    # Named (server-side) cursor: rows arrive in itersize batches instead of
+    # materializing the whole table in memory
+    with conn.cursor(name=f"export_{table_name}") as cur:
+        cur.itersize = 10_000
         cur.execute(f"SELECT * FROM {table_name}")
-        rows = cur.fetchall()
+        # description is only populated once the first batch is fetched
+        rows = iter(cur)
+        first_row = next(rows, None)
         
-        if not rows:
+        if first_row is None:
             print("No data found.")
             return
 
@@ -36,20 +63,12 @@ def export_table(table_name, conn, filename=None):
         target_file = filename or os.path.join(OUTPUT_DIR, f"{table_name}.csv")
 
         with open(target_file, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=[desc[0] for desc in cur.description], delimiter=';')
-            writer.writeheader()
-            
-            for row in rows:
-                row_dict = dict(row)
-                for key, value in row_dict.items():
-                    # Handle JSON objects
-                    if isinstance(value, (dict, list)):
-                        row_dict[key] = json.dumps(value, ensure_ascii=False)
-                    # Handle Text Cleaning
-                    elif key in RAG_CLEAN_COLUMNS and isinstance(value, str):
-                        row_dict[key] = clean_hs_label_for_rag(value)
-                
-                writer.writerow(row_dict)
+            colnames = [desc[0] for desc in cur.description]
+            json_idx = _json_columns(cur.description, first_row)
+            clean_idx = [i for i, name in enumerate(colnames) if name in RAG_CLEAN_COLUMNS]
+            writer = csv.writer(f, delimiter=';')
+            writer.writerow(colnames)
+            writer.writerows(_prepare_row(row, json_idx, clean_idx) for row in chain([first_row], rows))
     
     print(f"Done: {target_file}")
 
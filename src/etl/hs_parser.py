@@ -1,10 +1,71 @@
 """ADIL Text Parser module."""
 import re
+from functools import lru_cache
 from typing import Optional, Tuple, List, Dict
 from scraper.config import logger
 from cleaners import parse_french_date, remove_adil_boilerplate, clean_hs_label_for_rag, normalize_text
 from cleaning_constants import SECTION_CHAPTER_PATTERNS, TAX_PATTERNS, DOCUMENTS_KEYS, AGREEMENT_KEYS, BOILERPLATE
 
+REGIME_KEYWORDS = ("FRANCHISE", "DEMANTELEMENT", "ANNEXE", "AGRI", "LISTE", "PAYS MOINS", "PROTOCOLE")
+
+
+def _substring_re(phrases) -> re.Pattern:
+    """One compiled scan for "any of these phrases occurs in the line"."""
+    # "(?!)" never matches, so an empty phrase list keeps any() semantics
+    return re.compile("|".join(map(re.escape, phrases)) or "(?!)")
+
+
+# Compiled once at import; the parsers run on every HS record
+_SECTION_CHAPTER_CODE_RES = {
+    "SECTION_CODE": re.compile(SECTION_CHAPTER_PATTERNS["SECTION_CODE"]),
+    "CHAPTER_CODE": re.compile(SECTION_CHAPTER_PATTERNS["CHAPTER_CODE"]),
+}
+_FALLBACK_SPLIT_RE = re.compile(SECTION_CHAPTER_PATTERNS["FALLBACK_SPLIT"], re.DOTALL)
+_TAX_MAIN_RE = re.compile(TAX_PATTERNS["MAIN"])
+_TAX_CODE_FROM_KEY_RE = re.compile(TAX_PATTERNS["CODE_FROM_KEY"])
+_TAX_KEY_CLEAN_RE = re.compile(TAX_PATTERNS["KEY_CLEAN"])
+_DOC_CODE_RE = re.compile(r"^\d{3,5}$")
+# Classifies an (uppercased) agreement line in one match: rates (0, 2.5, 10%, (*)),
+# date stamps, regime keywords; anything else doesn't match
+_AGREEMENT_LINE_RE = re.compile(
+    r"(?P<rate>(?:[\d\.\,]+(?:\s*%)?|\(\*\))$)"
+    r"|(?P<date>.*?\d{2}/\d{2}/\d{4})"
+    r"|(?P<regime>.*?(?:" + "|".join(map(re.escape, REGIME_KEYWORDS)) + r"))",
+    re.DOTALL,
+)
+_DATE_RE = re.compile(r"\d{2}/\d{2}/\d{4}")
+_DASH_DESIGNATION_RE = re.compile(r"-\s*-+\s*(.*?)(?:\n|$)")
+
+# Noise filters: exact-line sets and substring scans
+_BP_EXACT = frozenset(BOILERPLATE)
+_BP_SUBSTR_RE = _substring_re([bp for bp in BOILERPLATE if len(bp) > 4])
+_TAX_KEY_SKIP_RE = _substring_re(["Position tarifaire", "Situation du", "Source", "ADiL"])
+_DOC_KEYS_RE = _substring_re(DOCUMENTS_KEYS)
+_DOC_EXACT_SKIP = frozenset(["AD", "i", "L", "ADII", "Source :", "Situation du :"])
+_AGREEMENT_EXACT_SKIP = frozenset(["Accords", "Liste", "DI", "( en % )", "TPI", "Source :", "ADII"])
+_AGREEMENT_SUBSTR_SKIP_RE = _substring_re(["Position tarifaire", "Situation du", "Accords et Conventions"])
+_AGREEMENT_SHORT_KEEP = frozenset(["UE", "UK"])
+
+
+def _stripped_lines(text: str) -> List[str]:
+    """Non-empty lines of text, stripped (each line is stripped only once)."""
+    return [line for raw_line in text.splitlines() if (line := raw_line.strip())]
+
+
+@lru_cache(maxsize=4096)
+def _label_pattern(label_pattern_key: str, code: str) -> re.Pattern:
+    """Compiled section/chapter label regex, shared by every product under that code."""
+    return re.compile(SECTION_CHAPTER_PATTERNS[label_pattern_key].format(code=code), re.DOTALL | re.I)
+
+
+@lru_cache(maxsize=4096)
+def _hs10_pattern(hs6_fmt: str) -> re.Pattern:
+    """Compiled HS10 designation regex for one HS6 heading ("0101.21")."""
+    return re.compile(
+        rf"{re.escape(hs6_fmt)}\s*\n?\s*(\d{{2}})\s*\n?\s*(\d{{2}})\s*\n?\s*-\s*-+\s*(.*?)(?:\n|$)",
+        re.DOTALL,
+    )
+
 def _extract_hierarchy_component(
     pos_tarifaire: dict, 
     component_type: str,
@@ -33,25 +94,24 @@ def _extract_hierarchy_component(
     
     # Strategy 1: Regex from raw text
     if not component_raw and raw_text:
-        match = re.search(SECTION_CHAPTER_PATTERNS[code_pattern_key], raw_text)
+        match = _SECTION_CHAPTER_CODE_RES[code_pattern_key].search(raw_text)
         if match:
             code = match.group(1)
-            pattern = SECTION_CHAPTER_PATTERNS[label_pattern_key].format(code=code)
-            match_lbl = re.search(pattern, raw_text, re.DOTALL | re.I)
+            match_lbl = _label_pattern(label_pattern_key, code).search(raw_text)
             if match_lbl:
                 label = match_lbl.group(1).strip()
     
     # Strategy 2: Fallback to structured key/value
     if component_raw and code == "NA":
-        match = re.match(SECTION_CHAPTER_PATTERNS["FALLBACK_SPLIT"], component_raw.strip(), re.DOTALL)
+        match = _FALLBACK_SPLIT_RE.match(component_raw.strip())
         if match:
             code = match.group(1)
             label = remove_adil_boilerplate(match.group(2).strip())
         else:
-            parts = component_raw.split("-", 1)
-            if len(parts) == 2:
-                code = parts[0].strip()
-                label = remove_adil_boilerplate(parts[1].strip())
+            head, sep, tail = component_raw.partition("-")
+            if sep:
+                code = head.strip()
+                label = remove_adil_boilerplate(tail.strip())
                 
     return code, label
 
@@ -87,13 +147,12 @@ def extract_designation(pos_tarifaire: dict, hs_code: str) -> str:
     if hs6_idx != -1:
         text_after = raw_text[hs6_idx:]
         
-        hs10_pattern = rf"{re.escape(hs6_fmt)}\s*\n?\s*(\d{{2}})\s*\n?\s*(\d{{2}})\s*\n?\s*-\s*-+\s*(.*?)(?:\n|$)"
-        match = re.search(hs10_pattern, text_after, re.DOTALL)
+        match = _hs10_pattern(hs6_fmt).search(text_after)
         
         if match and match.group(1) == hs_code[6:8] and match.group(2) == hs_code[8:10]:
             designation = match.group(3).strip()
         else:
-            match_des = re.search(r"-\s*-+\s*(.*?)(?:\n|$)", text_after)
+            match_des = _DASH_DESIGNATION_RE.search(text_after)
             if match_des:
                 designation = match_des.group(1).strip()
     
@@ -102,7 +161,6 @@ def extract_designation(pos_tarifaire: dict, hs_code: str) -> str:
     
     if designation and designation != "NA":
         designation = normalize_text(designation) or ""
-        designation = re.sub(r'\s+', ' ', designation)
         designation = remove_adil_boilerplate(designation)
         
     return designation
@@ -116,7 +174,7 @@ def extract_taxes(sections: dict) -> List[Dict[str, str]]:
     
     if raw_text:
         clean_raw = " ".join(raw_text.split())
-        matches = re.findall(TAX_PATTERNS["MAIN"], clean_raw)
+        matches = _TAX_MAIN_RE.findall(clean_raw)
         
         for label, code, value in matches:
             taxes.append({
@@ -128,12 +186,12 @@ def extract_taxes(sections: dict) -> List[Dict[str, str]]:
     if not taxes:
         tax_kv = tax_content.get("key_values", {})
         for key, value in tax_kv.items():
-            if any(x in key for x in ["Position tarifaire", "Situation du", "Source", "ADiL"]):
+            if _TAX_KEY_SKIP_RE.search(key):
                 continue
             
-            match_code = re.search(TAX_PATTERNS["CODE_FROM_KEY"], key)
+            match_code = _TAX_CODE_FROM_KEY_RE.search(key)
             code = match_code.group(1).strip() if match_code else "NA"
-            label = re.sub(TAX_PATTERNS["KEY_CLEAN"], "", key).split("(")[0].strip().replace("*", "")
+            label = _TAX_KEY_CLEAN_RE.sub("", key).split("(")[0].strip().replace("*", "")
             
             taxes.append({
                 "code": code,
@@ -151,22 +209,22 @@ def extract_documents(sections: dict) -> List[Dict[str, str]]:
     if not raw_text:
         return documents
 
-    lines = [l.strip() for l in raw_text.splitlines() if l.strip()]
+    lines = _stripped_lines(raw_text)
     current_doc = None
 
     for line in lines:
         # Strict boilerplate filtering
-        if any(k in line for k in DOCUMENTS_KEYS):
+        if _DOC_KEYS_RE.search(line):
             continue
-        if line in ["AD", "i", "L", "ADII", "Source :", "Situation du :"] or line in BOILERPLATE:
+        if line in _DOC_EXACT_SKIP or line in _BP_EXACT:
             continue
         # Check against raw BOILERPLATE list just in case
-        if any(bp in line for bp in BOILERPLATE if len(bp) > 4):
+        if _BP_SUBSTR_RE.search(line):
             continue
 
         # Document codes are typically 3-5 digits (e.g., 06002)
         # Some are alphanumeric but rare. The garbage "AD i" was matching < 10 len.
-        is_code = re.match(r"^\d{3,5}$", line)
+        is_code = _DOC_CODE_RE.match(line)
         
         if is_code:
             if current_doc:
@@ -213,35 +271,29 @@ def extract_agreements(sections: dict) -> List[Dict[str, str]]:
     if not raw_text:
         return agreements
         
-    lines = [l.strip() for l in raw_text.splitlines() if l.strip()]
+    lines = _stripped_lines(raw_text)
     
-    # Heuristics for field types
-    def is_rate_value(line):
-        # Matches numbers (0, 2.5, 10), percentages (10%), or special markers like (*)
-        return re.match(r"^[\d\.\,]+(\s*%)?$", line) or line == "(*)" or line == "0"
-
-    def is_regime_keyword(line):
-        keywords = ["FRANCHISE", "DEMANTELEMENT", "ANNEXE", "AGRI", "LISTE", "PAYS MOINS", "PROTOCOLE"]
-        return any(k in line.upper() for k in keywords)
-
     current_acc = None
     
     for line in lines:
         # 1. Filter out known headers/noise (Exact matches or safe substrings)
-        if line in ["Accords", "Liste", "DI", "( en % )", "TPI", "Source :", "ADII"]:
+        if line in _AGREEMENT_EXACT_SKIP:
             continue
-        if line in BOILERPLATE:
+        if line in _BP_EXACT:
             continue
-        if "Position tarifaire" in line or "Situation du" in line:
-            continue
-        if "Accords et Conventions" in line:
+        if _AGREEMENT_SUBSTR_SKIP_RE.search(line):
             continue
+
+        # Heuristics for field types ("rate", "date", "regime" or None)
+        match = _AGREEMENT_LINE_RE.match(line.upper())
+        kind = match.lastgroup if match else None
+
         # Filter very short garbage
-        if len(line) < 3 and not is_rate_value(line) and line not in ["UE", "UK"]:
+        if len(line) < 3 and kind != "rate" and line not in _AGREEMENT_SHORT_KEEP:
              continue
 
         # Filter dates (e.g., 01/02/2026 14:37:33)
-        if re.search(r"\d{2}/\d{2}/\d{4}", line):
+        if kind == "date":
             continue
 
         # Filter footnotes/legends (e.g., (*) Taux du Régime du Droit Commun)
@@ -249,7 +301,7 @@ def extract_agreements(sections: dict) -> List[Dict[str, str]]:
             continue
             
         # 2. Identify Line Type
-        if is_rate_value(line):
+        if kind == "rate":
             if current_acc:
                 if current_acc["DI"] == "NA":
                     current_acc["DI"] = line
@@ -258,7 +310,7 @@ def extract_agreements(sections: dict) -> List[Dict[str, str]]:
                 else:
                     # If we already have both rates, this might be a parsing artifact or extra column
                     pass 
-        elif is_regime_keyword(line):
+        elif kind == "regime":
             if current_acc:
                 # If we already have a list/regime, append to it (handles multi-line descriptions)
                 if current_acc["list"] == "NA":
@@ -304,11 +356,14 @@ def extract_history(sections: dict) -> List[Dict[str, str]]:
     raw_text = content.get("raw_text", "")
     history = []
     
-    lines = [l.strip() for l in raw_text.splitlines() if l.strip()]
+    lines = _stripped_lines(raw_text)
     
-    for i, line in enumerate(lines):
-        if re.match(r"\d{2}/\d{2}/\d{4}", line):
-            rate = lines[i+2] if i + 2 < len(lines) else ""
+    # The rate sits two lines below its date ("" near the end of the block)
+    for line, rate in zip(lines, lines[2:] + ["", ""]):
+        # Cheap positional check first: most lines can't be "dd/mm/yyyy"
+        if len(line) < 10 or line[2] != "/" or line[5] != "/":
+            continue
+        if _DATE_RE.match(line):
             history.append({
                 "date": parse_french_date(line),
                 "raw": f"Taux: {rate}"
@@ -332,13 +387,20 @@ def refine_hierarchy_labels(pos_tarifaire: dict, hs_code: str, designation: str)
     idx = raw_text.find(start_marker)
     text = raw_text[idx:] if idx != -1 else raw_text
 
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
-    clean_lines = lines[:-1] if lines else []
-    
     active_level = None
     labels = {"HS4": [], "HS6": [], "HS8": [], "HS10": []}
 
-    for line in clean_lines:
+    # Single pass, one non-empty line behind: the last non-empty line is
+    # never processed, without building a stripped copy of every line first
+    pending = None
+    for raw_line in text.splitlines():
+        current = raw_line.strip()
+        if not current:
+            continue
+        line, pending = pending, current
+        if line is None:
+            continue
+
         if line == hs4_fmt:
             active_level = "HS4"
             continue
@@ -352,7 +414,8 @@ def refine_hierarchy_labels(pos_tarifaire: dict, hs_code: str, designation: str)
             active_level = "HS10"
             continue
         
-        if active_level and not re.match(r"^\d+[\d\.]*$", line):
+        # Skip bare code fragments ("00", "0101.21"): a digit, then digits/dots only
+        if active_level and not (line[0].isdecimal() and line.replace(".", "").isdecimal()):
             labels[active_level].append(line)
 
     hs4 = clean_hs_label_for_rag(remove_adil_boilerplate(" ".join(labels["HS4"]))) or "NA"
@@ -375,9 +438,9 @@ def extract_unit_of_measure(pos_tarifaire: dict, raw_text: str) -> str:
     """Extract Unit of Measure."""
     uom = "NA"
     if raw_text:
-        lines = [l.strip() for l in raw_text.splitlines() if l.strip()]
-        if lines:
-            pot_unit = lines[-1]
+        # Only the last non-empty line matters, so scan from the end
+        pot_unit = next((line for line in map(str.strip, reversed(raw_text.splitlines())) if line), None)
+        if pot_unit:
             if len(pot_unit) <= 5: 
                 uom = pot_unit
             else:
@@ -11,7 +11,7 @@ DSN = _config.db_dsn
 def process_single_record(raw: dict, conn, commit_on_success: bool = False):
     """Transform and load a single raw record into the database."""
     hs_code = raw.get("hs_code", "Unknown")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         # 1. Transform
@@ -23,12 +23,12 @@ def process_single_record(raw: dict, conn, commit_on_success: bool = False):
         if commit_on_success:
             conn.commit()
             
-        duration = int((time.time() - start_time) * 1000)
+        duration = int((time.perf_counter() - start_time) * 1000)
         record_audit_log(hs_code, "SUCCESS", None, duration, conn)
         logger.info(f"Success: {hs_code}")
         
     except Exception as e:
-        duration = int((time.time() - start_time) * 1000)
+        duration = int((time.perf_counter() - start_time) * 1000)
         error_msg = str(e)
         status = "FAILED"
         if "validation" in error_msg.lower() or "valueerror" in error_msg.lower():
@@ -4,6 +4,25 @@ from psycopg2.extras import Json
 
 logger = logging.getLogger(__name__)
 
+# node_type -> (table, parent column, code column)
+NODE_TABLES = {
+    "HS4": ("hs4_nodes", "chapter_id", "hs4"),
+    "HS6": ("hs6_nodes", "hs4_id", "hs6"),
+}
+
+# Upsert statements are built once per node type instead of on every call
+NODE_UPSERT_SQL = {
+    node_type: f"""
+            INSERT INTO {table} ({parent_col}, {code_col}, label, present, meta)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT ({parent_col}, {code_col}) DO UPDATE SET 
+                label = EXCLUDED.label,
+                present = EXCLUDED.present
+            RETURNING id
+        """
+    for node_type, (table, parent_col, code_col) in NODE_TABLES.items()
+}
+
 class HSRepository:
     """
     Data Access Layer (Repository Pattern) for ADIL HS Products.
@@ -32,19 +51,7 @@ class HSRepository:
 
     def upsert_node(self, node_type, parent_id, code, label, meta):
         """Generic upsert for HS4 and HS6 nodes."""
-        table = "hs4_nodes" if node_type == "HS4" else "hs6_nodes"
-        parent_col = "chapter_id" if node_type == "HS4" else "hs4_id"
-        code_col = "hs4" if node_type == "HS4" else "hs6"
-        
-        sql = f"""
-            INSERT INTO {table} ({parent_col}, {code_col}, label, present, meta)
-            VALUES (%s, %s, %s, %s, %s)
-            ON CONFLICT ({parent_col}, {code_col}) DO UPDATE SET 
-                label = EXCLUDED.label,
-                present = EXCLUDED.present
-            RETURNING id
-        """
-        self.cur.execute(sql, (
+        self.cur.execute(NODE_UPSERT_SQL[node_type], (
             parent_id,
             code,
             label,
@@ -129,19 +129,19 @@ def transform(raw: dict) -> dict:
 
     # 6b. Calculate Canonical Hash (for Smart Update Detection)
     hash_payload = {
-        "designation": product["designation"],
-        "taxation": product["taxation"]["taxes"],
-        "documents": product["documents"]["documents"],
-        "agreements": product["accord_convention"]["accord_convention"],
-        "history": product["historique"]["items"]
+        "designation": final_designation,
+        "taxation": taxes,
+        "documents": documents,
+        "agreements": agreements,
+        "history": history
     }
     hash_str = json.dumps(hash_payload, sort_keys=True)
     product["canonical_hash"] = hashlib.sha256(hash_str.encode()).hexdigest()
-    product["canonical_text"] = f"Designation: {product['designation']}\n"
+    product["canonical_text"] = f"Designation: {final_designation}\n"
     
     # 7. Validate with Pydantic
     try:
-        HSProduct(**product)
+        HSProduct.model_validate(product)
         logger.debug(f"Data validation passed for {hs_code}")
     except Exception as e:
         logger.warning(f"Validation warning for {hs_code}: {e}")
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 @dataclass
 class ContentData:
@@ -30,3 +31,11 @@ class ScrapeResult:
     sections: List[Dict[str, Any]]
     summary: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+def to_dict(obj) -> Dict[str, Any]:
+    """Shallow dataclasses.asdict: nested containers are reused, not deep-copied"""
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
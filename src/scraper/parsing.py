@@ -10,10 +10,10 @@ class TextProcessor:
     KEY_VALUE_PATTERN = re.compile(r'([^:]+?)\s*(?:\([^)]*\))?\s*:\s*([^\n]+)')
     
     METADATA_PATTERNS = {
-        'position': r'Position tarifaire\s*:?\s*([^\n<]+)',
-        'source': r'Source\s*:?\s*([^\n<]+)',
-        'date': r'Situation du\s*:?\s*([^\n<]+)',
-        'unit': r'Unité.*?:?\s*([^\n<]+)'
+        'position': re.compile(r'Position tarifaire\s*:?\s*([^\n<]+)', re.IGNORECASE),
+        'source': re.compile(r'Source\s*:?\s*([^\n<]+)', re.IGNORECASE),
+        'date': re.compile(r'Situation du\s*:?\s*([^\n<]+)', re.IGNORECASE),
+        'unit': re.compile(r'Unité.*?:?\s*([^\n<]+)', re.IGNORECASE)
     }
     
     SECTION_TYPE_KEYWORDS = {
@@ -23,6 +23,17 @@ class TextProcessor:
         'regulatory': ['accord', 'restriction', 'prohibition', 'document', 'norme']
     }
 
+    # Compiled once: detect_section_type runs for every scraped section
+    HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+    SECTION_NAME_KEYWORDS = {
+        s_type: [k for k in keywords if not k.startswith('\\')]
+        for s_type, keywords in SECTION_TYPE_KEYWORDS.items()
+    }
+    SECTION_TYPE_PATTERNS = {
+        s_type: [re.compile(k) for k in keywords]
+        for s_type, keywords in SECTION_TYPE_KEYWORDS.items()
+    }
+
     @classmethod
     def process_content(cls, html_content: str) -> ContentData:
         """Process HTML into structured content using BeautifulSoup"""
@@ -133,8 +144,8 @@ class TextProcessor:
     @staticmethod
     def _clean_cell(text: str) -> str:
         """Clean header text"""
-        text = text.replace('\xa0', ' ').replace('\n', ' ')
-        return " ".join(text.strip().split())
+        # str.split() already treats NBSP and newlines as whitespace
+        return " ".join(text.split())
 
     @staticmethod
     def _normalize_cell(value: str) -> Any:
@@ -164,24 +175,24 @@ class TextProcessor:
     def extract_metadata(cls, text: str) -> Dict[str, str]:
         metadata = {}
         for key, pattern in cls.METADATA_PATTERNS.items():
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 metadata[key] = match.group(1).strip()
         return metadata
 
     @classmethod
     def detect_section_type(cls, section_name: str, content: str) -> str:
-        clean_content = re.sub(r'<[^>]+>', ' ', content).lower()
+        clean_content = cls.HTML_TAG_PATTERN.sub(' ', content).lower()
         section_name_lower = section_name.lower()
         
-        for s_type, keywords in cls.SECTION_TYPE_KEYWORDS.items():
-            if any(k in section_name_lower for k in keywords if isinstance(k, str) and not k.startswith('\\')):
+        for s_type, keywords in cls.SECTION_NAME_KEYWORDS.items():
+            if any(k in section_name_lower for k in keywords):
                 return s_type
 
         scores = defaultdict(int)
-        for section_type, patterns in cls.SECTION_TYPE_KEYWORDS.items():
+        for section_type, patterns in cls.SECTION_TYPE_PATTERNS.items():
             for pattern in patterns:
-                if re.search(pattern, clean_content):
+                if pattern.search(clean_content):
                     scores[section_type] += 1
         
         if not scores:
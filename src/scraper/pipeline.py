@@ -1,11 +1,12 @@
 import csv
 from pathlib import Path
 from typing import Dict, List, Optional, Set
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
 
 from .config import ScraperConfig, logger
 from .scraper import ADILScraper
+from .models import to_dict
 
 import threading
 
@@ -25,7 +26,7 @@ def scrape_single_code(hs_code: str, config: ScraperConfig) -> Dict:
             scraper.restart_driver()
             
         result = scraper.scrape_hs_code(hs_code)
-        return asdict(result)
+        return to_dict(result)
     except Exception as e:
         logger.error(f"Error in thread scraping {hs_code}: {e}")
         # On structural errors, a restart is safer
@@ -71,17 +72,30 @@ def main(
 
     logger.info(f"Starting batch process for {len(codes)} codes (Streaming Mode)...")
     with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
-        future_map = {executor.submit(scrape_single_code, code, config): code for code in codes}
+        # Bounded submission window: only a couple of codes are queued per worker,
+        # so memory stays flat and stopping early doesn't leave thousands of
+        # scrapes pending in the executor.
+        pending_codes = iter(codes)
+        max_in_flight = config.max_workers * 2
+        future_map = {}
+
+        def submit_next():
+            for code in islice(pending_codes, max_in_flight - len(future_map)):
+                future_map[executor.submit(scrape_single_code, code, config)] = code
         
         try:
-            for future in as_completed(future_map):
-                code = future_map[future]
-                try:
-                    res = future.result()
-                    logger.info(f"✅ Finished Scraping {code}")
-                    yield res
-                except Exception as e:
-                    logger.error(f"❌ Error on {code}: {e}")
+            submit_next()
+            while future_map:
+                done, _ = wait(future_map, return_when=FIRST_COMPLETED)
+                for future in done:
+                    code = future_map.pop(future)
+                    submit_next()
+                    try:
+                        res = future.result()
+                        logger.info(f"✅ Finished Scraping {code}")
+                        yield res
+                    except Exception as e:
+                        logger.error(f"❌ Error on {code}: {e}")
         finally:
             # Cleanup scrapers in all threads
             logger.info("Cleaning up shared browser instances...")
@@ -2,7 +2,6 @@ import time
 import random
 from datetime import datetime
 from typing import Dict, List, Optional
-from dataclasses import asdict
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,7 +9,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 from .config import ScraperConfig, logger
-from .models import ScrapeResult
+from .models import ScrapeResult, to_dict
 from .parsing import TextProcessor
 from .browser import WebDriverManager
 
@@ -118,7 +117,7 @@ class ADILScraper:
             html_content = self.driver.find_element(By.TAG_NAME, "body").get_attribute("outerHTML")
             
             content = self.processor.process_content(html_content)
-            result.main_content = asdict(content)
+            result.main_content = to_dict(content)
             
         except Exception as e:
             logger.warning(f"Main content scrape failed: {e}")
@@ -180,7 +179,7 @@ class ADILScraper:
             result.sections.append({
                 "section_name": section_name,
                 "section_type": section_type,
-                "content": asdict(processed),
+                "content": to_dict(processed),
                 "order": idx,
                 "scraped_at": datetime.now().isoformat()
             })